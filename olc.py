@@ -4,28 +4,59 @@ import os
 import argparse
 import sys
 import re
+import sqlite3
 from datetime import datetime
-from rich.console import Console
-from rich.table import Table
-from collections import defaultdict
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from urllib.parse import urlparse
-from cohere import ClientV2
+
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
 
 # Configuration
-DATA_FILE = "./links.json" # Change this to your desired data file path
-console = Console()
+DATA_FILE = os.getenv('OLC_DATA_FILE', "./links.json") # Change this to your desired data file path (*.jsonl for JSON Lines, *.db for SQLite, *.msgpack for MessagePack)
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB buffer for writes to the data file
 
 # Load API key from environment variable
 COHERE_API_KEY = os.getenv('COHERE_API_KEY')
 if not COHERE_API_KEY:
-    console.print("[red]✗ COHERE_API_KEY environment variable not set[/red]")
-    console.print("[yellow]ℹ Run: export COHERE_API_KEY='your_key_here'[/yellow]")
+    from rich.console import Console
+    Console().print(
+        "[red]✗ COHERE_API_KEY environment variable not set[/red]\n"
+        "[yellow]ℹ Run: export COHERE_API_KEY='your_key_here'[/yellow]"
+    )
     sys.exit(1)
 
+cohere_client = None  # Shared Cohere client, created on first use
+rich_console = None  # Shared Rich console, created on first output
+run_timestamp = None  # Timestamp shared by every entry written in this run
+data_cache = {}  # Parsed data file, keyed by (path, mtime, size)
+columns_cache = {}  # Column view of the data file, keyed by (path, mtime, size)
+db_connections = {}  # Open SQLite connections, keyed by path
+
 # === Utility Functions ===
+SCHEME_RE = re.compile(r'^https?://')
+TRAILING_COMMA_RE = re.compile(rb',\s*([}\]])')
+TRUTHY = frozenset({"true", "1", "yes", "y", "t"})
+# Separates fields in search haystacks so a term can never match across two fields.
+# Not NUL: SQLite truncates FTS text at an embedded NUL
+FIELD_SEP = '\x1f'
+# First byte of a MessagePack array (fixarray, array 16, array 32); never valid at the start of JSON
+MSGPACK_ARRAY_MARKERS = frozenset(range(0x90, 0xa0)) | {0xdc, 0xdd}
+# Entry fields holding text, lists of values and flags, as written by add
+TEXT_FIELDS = ("link", "name", "description", "type")
+LIST_FIELDS = ("subtypes", "tags", "roles", "data_types")
+BOOL_FIELDS = ("requires_account", "api_available")
+# Operations of the update/delete records logged in JSON Lines files
+LOG_OPS = frozenset({"upd", "del"})
+
+@lru_cache(maxsize=8192)
 def normalize_url(domain_or_url):
     """Convert domain name or URL to proper URL format"""
-    if not re.match(r'^https?://', domain_or_url):
+    if not SCHEME_RE.match(domain_or_url):
         domain_or_url = f'https://{domain_or_url}'
     # Ensure URL is properly formatted
     parsed = urlparse(domain_or_url)
@@ -33,42 +64,581 @@ def normalize_url(domain_or_url):
         domain_or_url = f'https://{parsed.path}'
     return domain_or_url
 
+@lru_cache(maxsize=8192)
 def extract_domain(url):
     """Extract domain from URL"""
     parsed = urlparse(url)
     return parsed.netloc or parsed.path.split('/')[0]
 
-def load_data():
-    """Load data with proper error handling"""
-    if not os.path.exists(DATA_FILE):
-        return []
-    
+def positive_int(value):
+    """argparse type for counts that must be at least 1"""
     try:
-        with open(DATA_FILE, 'r') as f:
-            content = f.read().strip()
-            if not content:
-                return []
-            content = re.sub(r',\s*([}\]])', r'\1', content)
-            return json.loads(content)
-    except json.JSONDecodeError as e:
-        console.print(f"[red]✗ Error loading data: {str(e)}[/red]")
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
+
+def parse_bool(value):
+    """Interpret a CLI flag value such as true/yes/1 as a boolean"""
+    return bool(value) and value.strip().lower() in TRUTHY
+
+@lru_cache(maxsize=8192)
+def link_key(url):
+    """Build the lookup key for a link (normalized URL without trailing slash)"""
+    return normalize_url(url).rstrip('/')
+
+def index_by_link(data):
+    """Map each link key to its first entry in data"""
+    index = {}
+    for e in data:
+        index.setdefault(link_key(e['link']), e)
+    return index
+
+def search_haystack(entry):
+    """Build the lowercased text searched by find, with fields separated by FIELD_SEP"""
+    return FIELD_SEP.join((
+        entry["name"],
+        entry["link"],
+        entry["description"],
+        entry["type"],
+        " ".join(entry.get("subtypes", [])),
+        " ".join(entry.get("tags", [])),
+        " ".join(entry.get("roles", [])),
+    )).lower()
+
+def compile_query(terms):
+    """Compile the search terms into one regex alternation"""
+    return re.compile("|".join(re.escape(t.lower()) for t in terms))
+
+def is_jsonl(path=None):
+    """Check whether a data file uses the JSON Lines (one entry per line) format"""
+    return (path or DATA_FILE).endswith('.jsonl')
+
+def is_sqlite(path=None):
+    """Check whether a data file is an SQLite database"""
+    return (path or DATA_FILE).endswith(('.db', '.sqlite'))
+
+def is_msgpack(path=None):
+    """Check whether a data file is written as MessagePack"""
+    return (path or DATA_FILE).endswith('.msgpack')
+
+def is_msgpack_data(content):
+    """Detect MessagePack content by its leading array marker"""
+    return bool(content) and content[0] in MSGPACK_ARRAY_MARKERS
+
+def file_is_msgpack(path):
+    """Detect a MessagePack data file by its first byte, whatever its extension"""
+    try:
+        with open(path, 'rb') as f:
+            return is_msgpack_data(f.read(1))
+    except OSError:
+        return False
+
+def writes_incrementally(path=None):
+    """Check whether single entries can be written without rewriting the whole file"""
+    return is_jsonl(path) or is_sqlite(path)
+
+def parse_json(content):
+    """Parse JSON text or bytes, preferring orjson when available"""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+def parse_data(content):
+    """Parse a whole JSON or MessagePack data file"""
+    if is_msgpack_data(content):
+        import msgpack  # Optional: only needed for MessagePack data files
+        return msgpack.unpackb(content, raw=False)
+    content = content.strip()
+    return parse_json(content) if content else []
+
+def intern_entry(entry):
+    """Intern repeated category strings so entries share one object per value"""
+    for key in ('type', 'cost', 'language'):
+        value = entry.get(key)
+        if isinstance(value, str):
+            entry[key] = sys.intern(value)
+    for key in ('subtypes', 'tags', 'roles'):
+        values = entry.get(key)
+        if values:
+            entry[key] = [sys.intern(v) if isinstance(v, str) else v for v in values]
+    return entry
+
+def is_log_record(record):
+    """Check whether a parsed JSON Lines row is an update/delete record rather than an entry"""
+    return (
+        isinstance(record, dict)
+        and record.get('op') in LOG_OPS
+        and isinstance(record.get('link'), str)
+        and (record['op'] != 'upd' or isinstance(record.get('entry'), dict))
+    )
+
+def read_log(path):
+    """Yield the live entries of a JSON Lines log, replaying update/delete records"""
+    # Update/delete records are rare, so collect them first and stream the rest
+    ops = {}
+    op_lines = set()
+    with open(path, 'rb') as f:
+        for lineno, line in enumerate(f):
+            # Cheap byte filter first; the parsed row then decides by its structure
+            if b'"op"' in line:
+                record = parse_json(line)
+                if is_log_record(record):
+                    ops.setdefault(link_key(record['link']), []).append((lineno, record))
+                    op_lines.add(lineno)
+
+    last_seen = {}  # Line of the last entry read for each key with records
+    with open(path, 'rb') as f:
+        for lineno, line in enumerate(f):
+            if not line.strip() or lineno in op_lines:
+                continue
+            entry = parse_json(line)
+            records = ops.get(link_key(entry['link'])) if ops else None
+            if records:
+                entry = replay(entry, lineno, records, last_seen)
+            if entry is not None:
+                yield entry
+
+def replay(entry, lineno, records, last_seen):
+    """Apply the records logged after an entry's line; None when it was deleted"""
+    key = link_key(entry['link'])
+    # Like edit on the other formats, an update only touches the first live entry
+    # with its key; a delete removes every live entry with the key
+    last_del = max((op_line for op_line, r in records if op_line < lineno and r['op'] == 'del'), default=-1)
+    shadowed = last_seen.get(key, -1) > last_del
+    last_seen[key] = lineno
+    for op_line, record in records:
+        if op_line < lineno:
+            continue
+        if record['op'] == 'del':
+            return None
+        if not shadowed:
+            entry = record['entry']
+    return entry
+
+def file_key(path):
+    """Identify the current version of a file by its path, mtime and size"""
+    st = os.stat(path)
+    return path, st.st_mtime_ns, st.st_size
+
+def read_data(path=None):
+    """Load every entry, reusing the last parse until the file changes (raises on errors)"""
+    path = path or DATA_FILE
+    if is_sqlite(path):
+        return [intern_entry(e) for e in db_iter(path)]
+    if not os.path.exists(path):
         return []
+
+    key = file_key(path)
+    if data_cache.get('key') == key:
+        return data_cache['data']
+
+    if is_jsonl(path):
+        data = [intern_entry(e) for e in read_log(path)]
+    else:
+        with open(path, 'rb') as f:
+            content = f.read()
+        try:
+            entries = parse_data(content)
+        except json.JSONDecodeError as e:
+            # Fall back to stripping trailing commas left by hand edits; the next save writes clean JSON
+            try:
+                entries = parse_data(TRAILING_COMMA_RE.sub(rb'\1', content))
+            except json.JSONDecodeError:
+                raise e from None
+        data = [intern_entry(e) for e in entries]
+    data_cache['key'] = key
+    data_cache['data'] = data
+    return data
+
+def read_entries(path=None):
+    """Yield entries one at a time (interned), streaming JSON Lines and SQLite files (raises on errors)"""
+    path = path or DATA_FILE
+    if not writes_incrementally(path):
+        yield from read_data(path)
+        return
+    if is_jsonl(path) and not os.path.exists(path):
+        return
+    yield from map(intern_entry, db_iter(path) if is_sqlite(path) else read_log(path))
+
+def report_load_error(e):
+    """Print why the data file could not be loaded and how to fix it"""
+    if isinstance(e, json.JSONDecodeError):
+        console().print(f"[red]✗ Error loading data: {str(e)}[/red]")
+        console().print("[yellow]ℹ Run: olc repair[/yellow]")
+    elif isinstance(e, ImportError):
+        console().print(f"[red]✗ Error loading data: {str(e)}[/red]")
+        console().print("[yellow]ℹ Run: pip install msgpack[/yellow]")
+    elif isinstance(e, sqlite3.Error):
+        console().print(f"[red]✗ Error loading data: {str(e)}[/red]")
+    else:
+        console().print(f"[red]✗ Unexpected error: {str(e)}[/red]")
+
+def load_data(path=None):
+    """Load data with proper error handling, returning no entries when the file can't be read"""
+    try:
+        return read_data(path)
     except Exception as e:
-        console.print(f"[red]✗ Unexpected error: {str(e)}[/red]")
+        report_load_error(e)
         return []
 
-def save_data(data):
+def iter_entries(path=None):
+    """Yield entries one at a time, stopping with an error message when the file can't be read"""
+    try:
+        yield from read_entries(path)
+    except Exception as e:
+        report_load_error(e)
+
+def stream_entries():
+    """Yield entries without parsing the whole file first (ijson for JSON arrays)"""
+    if writes_incrementally():
+        yield from iter_entries()
+        return
+    if is_msgpack() or file_is_msgpack(DATA_FILE):
+        yield from stream_msgpack()
+        return
+    try:
+        import ijson  # Optional: incremental JSON parsing
+    except ImportError:
+        yield from iter_entries()
+        return
+    if not os.path.exists(DATA_FILE):
+        return
+
+    try:
+        with open(DATA_FILE, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    except ijson.JSONError as e:
+        console().print(f"[red]✗ Error loading data: {str(e)}[/red]")
+        console().print("[yellow]ℹ Run: olc repair[/yellow]")
+
+def stream_msgpack():
+    """Yield entries from a MessagePack array one at a time"""
+    try:
+        import msgpack  # Optional: only needed for MessagePack data files
+    except ImportError:
+        yield from iter_entries()
+        return
+    if not os.path.exists(DATA_FILE):
+        return
+
+    try:
+        with open(DATA_FILE, 'rb') as f:
+            unpacker = msgpack.Unpacker(f, raw=False)
+            for _ in range(unpacker.read_array_header()):
+                yield unpacker.unpack()
+    except (msgpack.OutOfData, ValueError) as e:
+        console().print(f"[red]✗ Error loading data: {str(e)}[/red]")
+
+@dataclass
+class Columns:
+    """Column-oriented view of the fields read by ls and find (one list per field)"""
+    names: list = field(default_factory=list)
+    links: list = field(default_factory=list)
+    types: list = field(default_factory=list)
+    tags: list = field(default_factory=list)
+    ratings: list = field(default_factory=list)
+    blob: str = ""  # All search haystacks joined with NUL separators
+    starts: list = field(default_factory=list)  # Offset of each row in blob
+
+def load_columns():
+    """Build the column view of the data file, reusing it until the file changes"""
+    try:
+        # WAL writes may not touch the database file itself, so never cache it
+        key = None if is_sqlite() else file_key(DATA_FILE)
+    except OSError:
+        return Columns()
+    if key and columns_cache.get('key') == key:
+        return columns_cache['columns']
+
+    cols = Columns()
+    haystacks = []
+    for e in iter_entries():
+        cols.names.append(e["name"])
+        cols.links.append(e["link"])
+        cols.types.append(e["type"])
+        cols.tags.append(", ".join(e.get("tags", [])))
+        cols.ratings.append(e.get('metrics', {}).get('rating', 0))
+        haystacks.append(search_haystack(e))
+
+    cols.blob = '\0'.join(haystacks)
+    offset = 0
+    for haystack in haystacks:
+        cols.starts.append(offset)
+        offset += len(haystack) + 1
+    columns_cache['key'] = key
+    columns_cache['columns'] = cols
+    return cols
+
+def scan_blob(cols, terms):
+    """Return the rows containing any of the terms by scanning the joined blob"""
+    blob, starts = cols.blob, cols.starts
+    rows = []
+    if not starts:
+        return rows
+
+    if len(terms) == 1:
+        find_from = partial(blob.find, terms[0].lower())
+    else:
+        pattern = compile_query(terms)
+        def find_from(start):
+            match = pattern.search(blob, start)
+            return match.start() if match else -1
+
+    pos = find_from(0)
+    while pos != -1:
+        row = bisect_right(starts, pos) - 1
+        rows.append(row)
+        if row + 1 == len(starts):
+            break
+        # One hit per entry is enough, resume at the start of the next row
+        pos = find_from(starts[row + 1])
+    return rows
+
+def print_plain(rows):
+    """Write rows as tab-separated lines in a single write, bypassing Rich"""
+    sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+
+def serialize_entry(entry):
+    """Serialize a single entry to a compact JSON Lines record"""
+    if orjson:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+def serialize_data(data, path=None):
+    """Serialize data in the format of path (indented UTF-8 JSON unless JSON Lines or MessagePack)"""
+    if is_jsonl(path):
+        return b''.join(serialize_entry(e) for e in data)
+    if is_msgpack(path):
+        import msgpack  # Optional: only needed for MessagePack data files
+        return msgpack.packb(data, use_bin_type=True)
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2, ensure_ascii=False) + '\n').encode('utf-8')
+
+def save_data(data, path=None):
     """Save data with proper formatting"""
+    path = path or DATA_FILE
+    tmp = path + '.tmp'
+    try:
+        if is_sqlite(path):
+            db_save(data, path)
+            return True
+        # Serialize up front so the file is written with a single write() call,
+        # flush it to disk, then swap it in atomically so a crash never leaves
+        # a truncated or half-synced file behind
+        content = serialize_data(data, path)
+        with open(tmp, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            # Keep the data file's permissions (e.g. 0600) instead of the umask default
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        os.replace(tmp, path)
+        data_cache.clear()
+        return True
+    except Exception as e:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        console().print(f"[red]✗ Error saving data: {str(e)}[/red]")
+        return False
+
+def get_entry(key, data=None):
+    """Return the first entry with the given link key (from data when given), or None (raises on load errors)"""
+    if data is not None:
+        return index_by_link(data).get(key)
+    if is_sqlite():
+        row = open_db().execute(
+            "SELECT entry FROM links WHERE key = ? ORDER BY id LIMIT 1", (key,)
+        ).fetchone()
+        return parse_json(row[0]) if row else None
+    return next((e for e in read_entries() if link_key(e['link']) == key), None)
+
+# === SQLite Storage ===
+def open_db(path=None):
+    """Open (and create if needed) the SQLite database, reusing the connection"""
+    path = path or DATA_FILE
+    conn = db_connections.get(path)
+    if conn is None:
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        try:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS links (
+                    id INTEGER PRIMARY KEY,
+                    key TEXT NOT NULL,
+                    entry BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS links_key ON links(key);
+                CREATE VIRTUAL TABLE IF NOT EXISTS links_fts USING fts5(haystack, tokenize='trigram');
+            """)
+        except sqlite3.OperationalError as e:
+            conn.close()
+            # "no such module: fts5" / "no such tokenizer: trigram" on older SQLite builds
+            if str(e).startswith("no such"):
+                raise sqlite3.NotSupportedError(
+                    f"{e} (SQLite {sqlite3.sqlite_version}); .db data files need SQLite 3.34+ "
+                    "with FTS5, use a .json or .jsonl data file instead"
+                ) from None
+            raise
+        db_connections[path] = conn
+    return conn
+
+def db_insert(conn, entries):
+    """Insert entries and their search haystacks (caller manages the transaction)"""
+    for e in entries:
+        # Store the UTF-8 JSON bytes as a blob: no str decode on write or re-encode on read
+        cur = conn.execute(
+            "INSERT INTO links (key, entry) VALUES (?, ?)",
+            (link_key(e['link']), serialize_entry(e).rstrip(b'\n'))
+        )
+        conn.execute(
+            "INSERT INTO links_fts (rowid, haystack) VALUES (?, ?)",
+            (cur.lastrowid, search_haystack(e))
+        )
+    return len(entries)
+
+def db_iter(path=None):
+    """Yield the entries stored in the SQLite database in insertion order"""
+    for (entry,) in open_db(path).execute("SELECT entry FROM links ORDER BY id"):
+        yield parse_json(entry)
+
+def db_save(data, path=None):
+    """Replace every entry in the SQLite database within one transaction"""
+    conn = open_db(path)
+    with conn:
+        conn.execute("DELETE FROM links")
+        conn.execute("DELETE FROM links_fts")
+        db_insert(conn, data)
+
+def db_search(terms, limit=None):
+    """Return entries whose haystack contains any of the terms via the FTS index"""
+    # Terms of 3+ characters are quoted trigram phrases answered by the index;
+    # shorter terms have no trigram to look up and fall back to a LIKE scan
+    phrases = ['"' + t.lower().replace('"', '""') + '"' for t in terms if len(t) >= 3]
+    patterns = [
+        "%" + t.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        for t in terms if len(t) < 3
+    ]
+    selects, params = [], []
+    if phrases:
+        selects.append("SELECT rowid FROM links_fts WHERE links_fts MATCH ?")
+        params.append(" OR ".join(phrases))
+    for pattern in patterns:
+        selects.append("SELECT rowid FROM links_fts WHERE haystack LIKE ? ESCAPE '\\'")
+        params.append(pattern)
+    sql = f"SELECT entry FROM links WHERE id IN ({' UNION '.join(selects)}) ORDER BY id"
+    if limit:
+        sql += f" LIMIT {int(limit)}"
+    return [parse_json(entry) for (entry,) in open_db().execute(sql, params)]
+
+def db_update(conn, entry):
+    """Replace the first entry with the same link key and its haystack"""
+    row = conn.execute(
+        "SELECT id FROM links WHERE key = ? ORDER BY id LIMIT 1", (link_key(entry['link']),)
+    ).fetchone()
+    if row:
+        conn.execute(
+            "UPDATE links SET entry = ? WHERE id = ?",
+            (serialize_entry(entry).rstrip(b'\n'), row[0])
+        )
+        conn.execute("UPDATE links_fts SET haystack = ? WHERE rowid = ?", (search_haystack(entry), row[0]))
+    return row is not None
+
+def db_delete(conn, key):
+    """Delete the entries with the given link key and return how many were deleted"""
+    ids = conn.execute("SELECT id FROM links WHERE key = ?", (key,)).fetchall()
+    conn.executemany("DELETE FROM links_fts WHERE rowid = ?", ids)
+    conn.execute("DELETE FROM links WHERE key = ?", (key,))
+    return len(ids)
+
+def db_write(action, *args):
+    """Run action(conn, *args) in a single transaction, reporting SQLite errors"""
+    try:
+        with open_db() as conn:
+            return action(conn, *args)
+    except sqlite3.Error as e:
+        console().print(f"[red]✗ Error saving data: {str(e)}[/red]")
+        return None
+
+def append_records(records):
+    """Append records to the JSON Lines log in a single write"""
     try:
-        with open(DATA_FILE, 'w') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add newline at end of file
+        with open(DATA_FILE, 'ab+') as f:
+            # A hand-edited file may lack its final newline; don't glue the record onto the last line
+            lead = b''
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    lead = b'\n'
+            f.write(lead + b''.join(serialize_entry(r) for r in records))
+        return True
     except Exception as e:
-        console.print(f"[red]✗ Error saving data: {str(e)}[/red]")
+        console().print(f"[red]✗ Error saving data: {str(e)}[/red]")
+        return False
+
+def append_entries(data, entries):
+    """Add new entries, writing only those entries for JSON Lines and SQLite (data may be None)"""
+    if is_sqlite():
+        return bool(db_write(db_insert, entries))
+    if not is_jsonl():
+        data.extend(entries)
+        return save_data(data)
+    return append_records(entries)
+
+def update_entry(data, entry):
+    """Persist an edited entry, logging an update record for JSON Lines files"""
+    if is_sqlite():
+        return bool(db_write(db_update, entry))
+    if not is_jsonl():
+        return save_data(data)
+    return append_records([{"op": "upd", "link": link_key(entry['link']), "entry": entry}])
+
+def remove_entry(key):
+    """Remove the entries with the given link key and return how many were removed (raises on load errors)"""
+    if is_sqlite():
+        return db_write(db_delete, key) or 0
+    if not is_jsonl():
+        data = read_data()
+        new_data = [e for e in data if link_key(e['link']) != key]
+        removed = len(data) - len(new_data)
+        if removed and not save_data(new_data):
+            return 0
+        return removed
+
+    # Log a delete record instead of rewriting the file; compact drops it later
+    removed = sum(1 for e in read_entries() if link_key(e['link']) == key)
+    if removed and not append_records([{"op": "del", "link": key}]):
+        return 0
+    return removed
+
+def console():
+    """Return the shared Rich console, importing Rich only when something is printed"""
+    global rich_console
+    if rich_console is None:
+        from rich.console import Console
+        rich_console = Console()
+    return rich_console
+
+def timestamp():
+    """Return the ISO timestamp for entries written by this run"""
+    global run_timestamp
+    if run_timestamp is None:
+        run_timestamp = datetime.now().isoformat()
+    return run_timestamp
+
+def get_client():
+    """Return the shared Cohere client so requests reuse its connection pool"""
+    global cohere_client
+    if cohere_client is None:
+        from cohere import ClientV2  # Imported lazily: only AI-assisted adds need it
+        cohere_client = ClientV2(api_key=COHERE_API_KEY)
+    return cohere_client
 
 def analyze_website(link):
     """Use Cohere AI to analyze and classify the website"""
-    client = ClientV2(api_key=COHERE_API_KEY)
+    client = get_client()
     
     prompt = f"""Act as a website classifier and OSINT metadata formatter. Analyze this website: {link}
 
@@ -100,50 +670,56 @@ Format:
 ```"""
 
     try:
-        response = client.chat_stream(
+        response = client.chat(
             model="command-a-03-2025",
             messages=[{"role": "user", "content": [{"type": "text", "text": prompt}]}],
             temperature=0.3
         )
         
-        # Collect the full response
-        full_response = ""
-        for event in response:
-            if event.type == "content-delta":
-                full_response += event.delta.message.content.text
+        # The full reply arrives in one response, no need to stream deltas
+        full_response = "".join(
+            item.text for item in response.message.content or [] if item.type == "text"
+        )
         
         # Extract JSON from response
         json_start = full_response.find('{')
         json_end = full_response.rfind('}') + 1
         json_str = full_response[json_start:json_end]
         
-        return json.loads(json_str)
+        return parse_json(json_str)
     except Exception as e:
-        console.print(f"[red]✗ Error analyzing website: {str(e)}[/red]")
+        console().print(f"[red]✗ Error analyzing website: {str(e)}[/red]")
         return None
 
 # === Core Functions ===
 def add(args):
-    data = load_data()
-    
     if not args.link and not sys.stdin.isatty():
         args.link = sys.stdin.read().strip()
     
     if not args.link:
-        console.print("[red]✗ No domain or URL provided[/red]")
+        console().print("[red]✗ No domain or URL provided[/red]")
         return
     
     normalized_url = normalize_url(args.link)
     domain = extract_domain(normalized_url)
         
-    # Check if domain already exists (compare domains, not full URLs)
-    if any(e['link'] == args.link for e in data):
-        console.print(f"[red]✗ Entry for {domain} already exists[/red]")
+    # JSON Lines and SQLite write just the new entry, so skip loading every entry.
+    # Stop without saving when the file can't be read, or its entries would be lost
+    try:
+        data = None if writes_incrementally() else read_data()
+        existing = get_entry(link_key(normalized_url), data)
+    except Exception as e:
+        report_load_error(e)
+        return
+
+    # Check if link already exists (ignoring a trailing slash)
+    if existing is not None:
+        console().print(f"[red]✗ Entry for {domain} already exists[/red]")
         return
 
     # AI analysis when only domain/URL is provided
     if args.link and not args.name and not args.desc and not args.type:
-        console.print(f"[yellow]⚡ Analyzing {normalized_url} with AI...[/yellow]")
+        console().print(f"[yellow]⚡ Analyzing {normalized_url} with AI...[/yellow]")
         ai_data = analyze_website(normalized_url)
         if ai_data:
             args.name = ai_data.get('name', '')
@@ -159,6 +735,7 @@ def add(args):
             args.api = str(ai_data.get('api_available', False))
             args.rating = str(ai_data.get('metrics', {}).get('rating', 0.0))
 
+    now = timestamp()
     entry = {
         "link": normalized_url,
         "name": args.name or domain,
@@ -169,27 +746,140 @@ def add(args):
         "roles": args.roles.split(",") if args.roles else [],
         "language": args.lang or "en",
         "cost": args.cost or "free",
-        "requires_account": args.account.lower() == "true" if args.account else False,
+        "requires_account": parse_bool(args.account),
         "data_types": args.data_types.split(",") if args.data_types else [],
-        "api_available": args.api.lower() == "true" if args.api else False,
+        "api_available": parse_bool(args.api),
         "metrics": {
             "rating": float(args.rating) if args.rating else 0.0,
             "rating_count": int(args.rating_count) if args.rating_count else 0
         },
-        "date_collected": datetime.now().isoformat(),
-        "date_updated": datetime.now().isoformat()
+        "date_collected": now,
+        "date_updated": now
     }
     
-    data.append(entry)
-    save_data(data)
-    console.print(f"[green]✓ Entry added for {normalized_url}[/green]")
+    append_entries(data, [entry])
+    console().print(f"[green]✓ Entry added for {normalized_url}[/green]")
+
+def is_number(value):
+    """Check for an int or float value (bool excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def valid_record(record):
+    """Check that an import record has a link and that its fields have the types add writes"""
+    if not isinstance(record, dict):
+        return False
+    metrics = record.get("metrics", {})
+    return (
+        isinstance(record.get("link"), str) and bool(record["link"].strip())
+        and all(isinstance(record.get(k, ""), str) for k in TEXT_FIELDS)
+        and all(
+            isinstance(v, str) or isinstance(v, list) and all(isinstance(i, str) for i in v)
+            for v in (record.get(k, []) for k in LIST_FIELDS)
+        )
+        and all(isinstance(record.get(k, False), bool) for k in BOOL_FIELDS)
+        and isinstance(metrics, dict)
+        and all(is_number(metrics.get(k, 0)) for k in ("rating", "rating_count"))
+    )
+
+def complete_entry(record):
+    """Fill in the fields missing from an imported record with the same defaults as add"""
+    url = normalize_url(record["link"])
+    domain = extract_domain(url)
+    now = timestamp()
+    entry = {
+        "link": url,
+        "name": domain,
+        "description": f"Website for {domain}",
+        "type": "website",
+        "subtypes": [],
+        "tags": [],
+        "roles": [],
+        "language": "en",
+        "cost": "free",
+        "requires_account": False,
+        "data_types": [],
+        "api_available": False,
+        "metrics": {"rating": 0.0, "rating_count": 0},
+        "date_collected": now,
+        "date_updated": now
+    }
+    entry.update(record)
+    entry["link"] = url
+    # Accept comma-separated strings for list fields, as the add options do
+    for key in LIST_FIELDS:
+        if isinstance(entry[key], str):
+            entry[key] = entry[key].split(",") if entry[key] else []
+    return entry
+
+def read_records(src):
+    """Read import records from a JSON Lines file, or from stdin when src is '-'"""
+    f = sys.stdin.buffer if src == '-' else open(src, 'rb')
+    try:
+        return [parse_json(line) for line in f if line.strip()]
+    finally:
+        if f is not sys.stdin.buffer:
+            f.close()
+
+def bulk_add(args):
+    try:
+        records = read_records(args.src)
+    except OSError as e:
+        console().print(f"[red]✗ Unable to read {args.src}: {str(e)}[/red]")
+        return
+    except json.JSONDecodeError as e:
+        console().print(f"[red]✗ Invalid record in {args.src}: {str(e)}[/red]")
+        return
+
+    invalid = [r for r in records if not valid_record(r)]
+    if invalid:
+        console().print(f"[red]✗ {len(invalid)} record(s) in {args.src} have no link or fields of the wrong type[/red]")
+        return
+    # A top-level "op" key is reserved for the update/delete records of JSON Lines files
+    reserved = [r for r in records if "op" in r]
+    if reserved:
+        console().print(f"[red]✗ {len(reserved)} record(s) in {args.src} use the reserved 'op' key[/red]")
+        return
+
+    # Load once and check every record against one set of link keys;
+    # a partial read would let duplicates through, so stop on load errors
+    try:
+        data = None if writes_incrementally() else read_data()
+        seen = {link_key(e['link']) for e in (data if data is not None else read_entries())}
+    except Exception as e:
+        report_load_error(e)
+        return
+
+    entries = []
+    for record in records:
+        key = link_key(record["link"])
+        if key not in seen:
+            seen.add(key)
+            entries.append(complete_entry(record))
+
+    skipped = len(records) - len(entries)
+    if not entries:
+        console().print(f"[yellow]No new entries ({skipped} already exist)[/yellow]")
+        return
+    # One write (or one SQLite transaction) for the whole batch
+    if append_entries(data, entries):
+        console().print(f"[green]✓ Added {len(entries)} entries ({skipped} skipped as duplicates)[/green]")
 
 def ls(args):
-    data = load_data()
-    if not data:
-        console.print("[yellow]No entries found.[/yellow]")
+    cols = load_columns()
+    if not cols.links:
+        console().print("[yellow]No entries found.[/yellow]")
+        return
+
+    rows = zip(cols.names, cols.links, cols.types, cols.tags, cols.ratings)
+    if args.plain:
+        print_plain(
+            (str(i), name, link, type_, tags, f"{rating:.1f}")
+            for i, (name, link, type_, tags, rating) in enumerate(rows, 1)
+        )
         return
 
+    from rich.table import Table
+
     table = Table(title="🔗 OSINT Useful Links")
     table.add_column("#", style="dim", width=4)
     table.add_column("Name", style="cyan", width=20)
@@ -198,193 +888,328 @@ def ls(args):
     table.add_column("Tags", style="yellow", width=20)
     table.add_column("Rating", style="green", width=8)
 
-    for i, e in enumerate(data, 1):
-        tags = ", ".join(e.get("tags", []))[:18] + "..." if e.get("tags") else ""
-        rating = f"{e.get('metrics', {}).get('rating', 0):.1f}★"
+    for i, (name, link, type_, tags, rating) in enumerate(rows, 1):
         table.add_row(
             str(i), 
-            e["name"], 
-            e["link"],
-            e["type"], 
-            tags,
-            rating
+            name, 
+            link,
+            type_, 
+            tags[:18] + "..." if tags else "",
+            f"{rating:.1f}★"
         )
-    console.print(table)
+    console().print(table)
 
 def edit(args):
-    data = load_data()
     search_url = normalize_url(args.link)
-    # search_domain = extract_domain(search_url)
-    
-    for entry in data:
-        if entry["link"] == search_url:
-            if args.name: entry["name"] = args.name
-            if args.desc: entry["description"] = args.desc
-            if args.type: entry["type"] = args.type
-            if args.sub: entry["subtypes"] = args.sub
-            if args.tags: entry["tags"] = args.tags.split(",")
-            if args.roles: entry["roles"] = args.roles.split(",")  
-            if args.rating: entry["metrics"]["rating"] = float(args.rating)
-            if args.rating_count: entry["metrics"]["rating_count"] = int(args.rating_count)
-            if args.cost: entry["cost"] = args.cost
-            if args.lang: entry["language"] = args.lang
-            if args.account: entry["requires_account"] = args.account.lower() == "true"
-            if args.api: entry["api_available"] = args.api.lower() == "true"
-            entry["date_updated"] = datetime.now().isoformat()
-            save_data(data)
-            console.print(f"[blue]~ Updated entry for {entry['link']}[/blue]")
-            return
-    console.print(f"[red]✗ No entry found for {search_url}[/red]")
+    try:
+        data = None if writes_incrementally() else read_data()
+        entry = get_entry(link_key(search_url), data)
+    except Exception as e:
+        report_load_error(e)
+        return
+    if entry is None:
+        console().print(f"[red]✗ No entry found for {search_url}[/red]")
+        return
+
+    if args.name: entry["name"] = args.name
+    if args.desc: entry["description"] = args.desc
+    if args.type: entry["type"] = args.type
+    if args.sub: entry["subtypes"] = args.sub
+    if args.tags: entry["tags"] = args.tags.split(",")
+    if args.roles: entry["roles"] = args.roles.split(",")  
+    if args.rating: entry["metrics"]["rating"] = float(args.rating)
+    if args.rating_count: entry["metrics"]["rating_count"] = int(args.rating_count)
+    if args.cost: entry["cost"] = args.cost
+    if args.lang: entry["language"] = args.lang
+    if args.account: entry["requires_account"] = parse_bool(args.account)
+    if args.api: entry["api_available"] = parse_bool(args.api)
+    entry["date_updated"] = timestamp()
+    update_entry(data, entry)
+    console().print(f"[blue]~ Updated entry for {entry['link']}[/blue]")
 
 def rm(args):
-    data = load_data()
-    
     if not args.link and not sys.stdin.isatty():
         args.link = sys.stdin.read().strip()
     
     if not args.link:
-        console.print("[red]✗ No domain or URL provided[/red]")
+        console().print("[red]✗ No domain or URL provided[/red]")
         return
 
     search_url = normalize_url(args.link)
-    search_domain = extract_domain(search_url)
     
-    new_data = [e for e in data if extract_domain(e["link"]) != search_domain]
-    if len(new_data) == len(data):
-        console.print(f"[red]✗ No entry found for {search_url}[/red]")
+    try:
+        removed = remove_entry(link_key(search_url))
+    except Exception as e:
+        report_load_error(e)
+        return
+    if not removed:
+        console().print(f"[red]✗ No entry found for {search_url}[/red]")
     else:
-        save_data(new_data)
-        console.print(f"[red]- Deleted entry for {search_url}[/red]")
+        console().print(f"[red]- Deleted entry for {search_url}[/red]")
 
 def find(args):
-    data = load_data()
-    keyword = args.query.lower()
+    query = "' or '".join(args.query)
     results = []
 
-    for e in data:
-        domain = extract_domain(e["link"])
-        if (keyword in e["name"].lower() or
-            keyword in e["link"].lower() or
-            keyword in domain.lower() or
-            keyword in e["description"].lower() or
-            keyword in e["type"].lower() or
-            keyword in " ".join(e.get("subtypes", [])).lower() or
-            keyword in " ".join(e.get("tags", [])).lower() or
-            keyword in " ".join(e.get("roles", [])).lower()):
-            results.append(e)
+    if is_sqlite():
+        # The FTS index does the matching (and the limit) inside SQLite
+        try:
+            results = [
+                (e["name"], e["link"], e["type"], e.get('metrics', {}).get('rating', 0))
+                for e in db_search(args.query, args.limit)
+            ]
+        except sqlite3.Error as e:
+            console().print(f"[red]✗ Error searching data: {str(e)}[/red]")
+            return
+    elif args.limit:
+        # Stream entries and stop as soon as enough matches were found
+        pattern = compile_query(args.query)
+        for e in stream_entries():
+            if pattern.search(search_haystack(e)):
+                results.append((e["name"], e["link"], e["type"], e.get('metrics', {}).get('rating', 0)))
+                if len(results) == args.limit:
+                    break
+    else:
+        # One C-level scan over every haystack; the domain is part of the link already
+        cols = load_columns()
+        results = [
+            (cols.names[i], cols.links[i], cols.types[i], cols.ratings[i])
+            for i in scan_blob(cols, args.query)
+        ]
 
     if not results:
-        console.print(f"[yellow]No results for '{args.query}'[/yellow]")
+        console().print(f"[yellow]No results for '{query}'[/yellow]")
+        return
+
+    if args.plain:
+        print_plain(
+            (name, link, type_, f"{rating:.1f}")
+            for name, link, type_, rating in results
+        )
         return
 
-    table = Table(title=f"🔍 Search Results for '{args.query}'")
+    from rich.table import Table
+
+    table = Table(title=f"🔍 Search Results for '{query}'")
     table.add_column("Name", style="cyan", width=20)
     table.add_column("URL", style="blue", width=30, overflow="fold")
     table.add_column("Type", style="magenta", width=12)
     table.add_column("Rating", style="green", width=8)
 
-    for e in results:
-        rating = f"{e.get('metrics', {}).get('rating', 0):.1f}★"
+    for name, link, type_, rating in results:
         table.add_row(
-            e["name"], 
-            e["link"],
-            e["type"], 
-            rating
+            name, 
+            link,
+            type_, 
+            f"{rating:.1f}★"
         )
-    console.print(table)
+    console().print(table)
 
 def view_details(args):
-    data = load_data()
+    from rich.console import Group
+    from rich.table import Table
+
     search_url = normalize_url(args.link)
     print(search_url)
-    search_domain = extract_domain(search_url)
+    try:
+        entry = get_entry(link_key(search_url))
+    except Exception as e:
+        report_load_error(e)
+        return
+    if entry is None:
+        console().print(f"[red]✗ No entry found for {search_url}[/red]")
+        return
+
+    details = Table(show_header=False)
+    details.add_column("Field", style="cyan")
+    details.add_column("Value", style="white")
     
-    for entry in data:
-        if entry["link"] == search_url:
-            console.print(f"\n[bold cyan]{entry['name']}[/bold cyan]")
-            console.print(f"[blue]{entry['link']}[/blue]")
-            console.print(f"\n[bold]Description:[/bold] {entry['description']}")
-            
-            details = Table(show_header=False)
-            details.add_column("Field", style="cyan")
-            details.add_column("Value", style="white")
-            
-            details.add_row("URL", entry["link"])
-            details.add_row("Type", entry["type"])
-            details.add_row("Subtypes", ", ".join(entry.get("subtypes", [])))
-            details.add_row("Tags", ", ".join(entry.get("tags", [])))
-            details.add_row("Roles", ", ".join(entry.get("roles", []))) 
-            details.add_row("Language", entry.get("language", "en"))
-            details.add_row("Cost", entry.get("cost", "unknown"))
-            details.add_row("Requires Account", "Yes" if entry.get("requires_account") else "No")
-            details.add_row("API Available", "Yes" if entry.get("api_available") else "No")
-            details.add_row("Rating", f"{entry.get('metrics', {}).get('rating', 0):.1f} (based on {entry.get('metrics', {}).get('rating_count', 0)} reviews)")
-            details.add_row("Data Types", ", ".join(entry.get("data_types", [])))
-            details.add_row("Date Collected", entry["date_collected"])
-            details.add_row("Last Updated", entry.get("date_updated", "never"))
-            
-            console.print(details)
-            return
-    console.print(f"[red]✗ No entry found for {search_url}[/red]")
+    details.add_row("URL", entry["link"])
+    details.add_row("Type", entry["type"])
+    details.add_row("Subtypes", ", ".join(entry.get("subtypes", [])))
+    details.add_row("Tags", ", ".join(entry.get("tags", [])))
+    details.add_row("Roles", ", ".join(entry.get("roles", []))) 
+    details.add_row("Language", entry.get("language", "en"))
+    details.add_row("Cost", entry.get("cost", "unknown"))
+    details.add_row("Requires Account", "Yes" if entry.get("requires_account") else "No")
+    details.add_row("API Available", "Yes" if entry.get("api_available") else "No")
+    details.add_row("Rating", f"{entry.get('metrics', {}).get('rating', 0):.1f} (based on {entry.get('metrics', {}).get('rating_count', 0)} reviews)")
+    details.add_row("Data Types", ", ".join(entry.get("data_types", [])))
+    details.add_row("Date Collected", entry["date_collected"])
+    details.add_row("Last Updated", entry.get("date_updated", "never"))
+    
+    # Render header, description and table in a single print call
+    console().print(Group(
+        f"\n[bold cyan]{entry['name']}[/bold cyan]",
+        f"[blue]{entry['link']}[/blue]",
+        f"\n[bold]Description:[/bold] {entry['description']}",
+        details,
+    ))
+
+def convert(args):
+    data = load_data()
+    if not data:
+        console().print("[yellow]No entries found.[/yellow]")
+        return
+
+    if os.path.abspath(args.dest) == os.path.abspath(DATA_FILE):
+        console().print("[red]✗ Destination must differ from the current data file[/red]")
+        return
+
+    if save_data(data, args.dest):
+        fmt = ("SQLite" if is_sqlite(args.dest) else "JSON Lines" if is_jsonl(args.dest)
+               else "MessagePack" if is_msgpack(args.dest) else "JSON")
+        console().print(f"[green]✓ Converted {len(data)} entries to {args.dest} ({fmt})[/green]")
+
+def compact(args):
+    if not is_jsonl():
+        console().print("[yellow]Only JSON Lines data files need compacting.[/yellow]")
+        return
+    if not os.path.exists(DATA_FILE):
+        console().print("[yellow]No entries found.[/yellow]")
+        return
+
+    try:
+        data = list(read_log(DATA_FILE))
+    except json.JSONDecodeError as e:
+        console().print(f"[red]✗ Error loading data: {str(e)}[/red]")
+        console().print("[yellow]ℹ Run: olc repair[/yellow]")
+        return
+
+    if save_data(data):
+        console().print(f"[green]✓ Compacted {DATA_FILE} to {len(data)} entries[/green]")
+
+def repair(args):
+    if is_sqlite() or is_msgpack():
+        console().print("[yellow]Only JSON and JSON Lines data files can be repaired.[/yellow]")
+        return
+    if not os.path.exists(DATA_FILE):
+        console().print("[yellow]No entries found.[/yellow]")
+        return
+
+    with open(DATA_FILE, 'rb') as f:
+        content = f.read()
+    if is_msgpack_data(content):
+        console().print("[yellow]Only JSON and JSON Lines data files can be repaired.[/yellow]")
+        return
+
+    # Strip trailing commas left behind by hand edits
+    fixed = TRAILING_COMMA_RE.sub(rb'\1', content)
+    try:
+        if is_jsonl():
+            data = [parse_json(line) for line in fixed.splitlines() if line.strip()]
+        else:
+            data = parse_json(fixed) if fixed.strip() else []
+    except json.JSONDecodeError as e:
+        console().print(f"[red]✗ Unable to repair data: {str(e)}[/red]")
+        return
+
+    if fixed == content:
+        console().print("[green]✓ No repairs needed[/green]")
+    elif save_data(data):
+        console().print(f"[green]✓ Repaired {DATA_FILE} ({len(data)} entries)[/green]")
 
 # === Main Function ===
+COMMANDS = ("add", "bulk-add", "ls", "edit", "rm", "find", "view", "convert", "compact", "repair")
+
 def main():
-    parser = argparse.ArgumentParser(description="🔗 OSINT Link Manager with AI Classification")
+    # Spell out the usage line: it would otherwise list only the subparsers that were built
+    parser = argparse.ArgumentParser(
+        description="🔗 OSINT Link Manager with AI Classification",
+        usage=f"%(prog)s [-h] {{{','.join(COMMANDS)}}} ...",
+    )
     sub = parser.add_subparsers(title="Commands")
 
+    # Only the invoked command's parser is built; all of them for help or unknown commands
+    command = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] in COMMANDS else None
+
+    def wants(name):
+        return command is None or command == name
+
     # Add command
-    p_add = sub.add_parser("add", help="Add new link (AI auto-fill when only domain/URL provided)")
-    p_add.add_argument("-l", "--link", help="Domain name (example.com) or URL (https://example.com)")
-    p_add.add_argument("-n", "--name", help="Name of the resource")
-    p_add.add_argument("-d", "--desc", help="Description")
-    p_add.add_argument("-t", "--type", help="Main type/category")
-    p_add.add_argument("--sub", nargs="+", help="One or more subtypes")
-    p_add.add_argument("--tags", help="Comma-separated tags")
-    p_add.add_argument("--roles", help="Comma-separated user roles")  
-    p_add.add_argument("--lang", help="Language (default: en)")
-    p_add.add_argument("--cost", help="Cost model (free/freemium/paid)")
-    p_add.add_argument("--account", help="Requires account (true/false)")
-    p_add.add_argument("--data_types", help="Comma-separated data types")
-    p_add.add_argument("--api", help="API available (true/false)")
-    p_add.add_argument("--rating", help="Rating (0-5)")
-    p_add.add_argument("--rating_count", help="Number of ratings")
-    p_add.set_defaults(func=add)
+    if wants("add"):
+        p_add = sub.add_parser("add", help="Add new link (AI auto-fill when only domain/URL provided)")
+        p_add.add_argument("-l", "--link", help="Domain name (example.com) or URL (https://example.com)")
+        p_add.add_argument("-n", "--name", help="Name of the resource")
+        p_add.add_argument("-d", "--desc", help="Description")
+        p_add.add_argument("-t", "--type", help="Main type/category")
+        p_add.add_argument("--sub", nargs="+", help="One or more subtypes")
+        p_add.add_argument("--tags", help="Comma-separated tags")
+        p_add.add_argument("--roles", help="Comma-separated user roles")  
+        p_add.add_argument("--lang", help="Language (default: en)")
+        p_add.add_argument("--cost", help="Cost model (free/freemium/paid)")
+        p_add.add_argument("--account", help="Requires account (true/false)")
+        p_add.add_argument("--data_types", help="Comma-separated data types")
+        p_add.add_argument("--api", help="API available (true/false)")
+        p_add.add_argument("--rating", help="Rating (0-5)")
+        p_add.add_argument("--rating_count", help="Number of ratings")
+        p_add.set_defaults(func=add)
+
+    # Bulk add command
+    if wants("bulk-add"):
+        p_bulk = sub.add_parser("bulk-add", help="Add many links from a JSON Lines file in one write (no AI analysis)")
+        p_bulk.add_argument("--from", dest="src", required=True, help="JSON Lines file with one entry per line, or - for stdin")
+        p_bulk.set_defaults(func=bulk_add)
 
     # List command
-    p_ls = sub.add_parser("ls", help="List all links")
-    p_ls.set_defaults(func=ls)
+    if wants("ls"):
+        p_ls = sub.add_parser("ls", help="List all links")
+        p_ls.add_argument("--plain", action="store_true", help="Print tab-separated rows instead of a table (faster for large collections)")
+        p_ls.set_defaults(func=ls)
 
     # Edit command
-    p_edit = sub.add_parser("edit", help="Edit a link")
-    p_edit.add_argument("-l", "--link", required=True, help="Domain name (example.com) or URL (https://example.com) to edit")
-    p_edit.add_argument("-n", "--name", help="New name")
-    p_edit.add_argument("-d", "--desc", help="New description")
-    p_edit.add_argument("-t", "--type", help="New type")
-    p_edit.add_argument("--sub", nargs="+", help="New subtypes")
-    p_edit.add_argument("--tags", help="Comma-separated tags")
-    p_edit.add_argument("--roles", help="Comma-separated user roles") 
-    p_edit.add_argument("--rating", help="New rating (0-5)")
-    p_edit.add_argument("--rating_count", help="New rating count")
-    p_edit.add_argument("--cost", help="New cost model")
-    p_edit.add_argument("--lang", help="New language")
-    p_edit.add_argument("--account", help="New requires account (true/false)")
-    p_edit.add_argument("--api", help="New API available (true/false)")
-    p_edit.set_defaults(func=edit)
+    if wants("edit"):
+        p_edit = sub.add_parser("edit", help="Edit a link")
+        p_edit.add_argument("-l", "--link", required=True, help="Domain name (example.com) or URL (https://example.com) to edit")
+        p_edit.add_argument("-n", "--name", help="New name")
+        p_edit.add_argument("-d", "--desc", help="New description")
+        p_edit.add_argument("-t", "--type", help="New type")
+        p_edit.add_argument("--sub", nargs="+", help="New subtypes")
+        p_edit.add_argument("--tags", help="Comma-separated tags")
+        p_edit.add_argument("--roles", help="Comma-separated user roles") 
+        p_edit.add_argument("--rating", help="New rating (0-5)")
+        p_edit.add_argument("--rating_count", help="New rating count")
+        p_edit.add_argument("--cost", help="New cost model")
+        p_edit.add_argument("--lang", help="New language")
+        p_edit.add_argument("--account", help="New requires account (true/false)")
+        p_edit.add_argument("--api", help="New API available (true/false)")
+        p_edit.set_defaults(func=edit)
 
     # Remove command
-    p_rm = sub.add_parser("rm", help="Remove a link")
-    p_rm.add_argument("-l", "--link", help="Domain name (example.com) or URL (https://example.com) to remove")
-    p_rm.set_defaults(func=rm)
+    if wants("rm"):
+        p_rm = sub.add_parser("rm", help="Remove a link")
+        p_rm.add_argument("-l", "--link", help="Domain name (example.com) or URL (https://example.com) to remove")
+        p_rm.set_defaults(func=rm)
 
     # Find command
-    p_find = sub.add_parser("find", help="Search links")
-    p_find.add_argument("query", help="Search term")
-    p_find.set_defaults(func=find)
+    if wants("find"):
+        p_find = sub.add_parser("find", help="Search links")
+        p_find.add_argument("query", nargs="+", help="Search term(s); entries matching any term are shown")
+        p_find.add_argument("--plain", action="store_true", help="Print tab-separated rows instead of a table")
+        p_find.add_argument("--limit", type=positive_int, help="Stop after this many results (streams the data file)")
+        p_find.set_defaults(func=find)
 
     # View command
-    p_view = sub.add_parser("view", help="View detailed information")
-    p_view.add_argument("-l", "--link", required=True, help="Domain name (example.com) or URL (https://example.com) to view")
-    p_view.set_defaults(func=view_details)
+    if wants("view"):
+        p_view = sub.add_parser("view", help="View detailed information")
+        p_view.add_argument("-l", "--link", required=True, help="Domain name (example.com) or URL (https://example.com) to view")
+        p_view.set_defaults(func=view_details)
+
+    # Convert command
+    if wants("convert"):
+        p_convert = sub.add_parser("convert", help="Copy all links to another data file (*.jsonl for JSON Lines, *.db for SQLite, *.msgpack for MessagePack)")
+        p_convert.add_argument("dest", help="Destination data file path")
+        p_convert.set_defaults(func=convert)
+
+    # Compact command
+    if wants("compact"):
+        p_compact = sub.add_parser("compact", help="Rewrite a JSON Lines data file without its update/delete records")
+        p_compact.set_defaults(func=compact)
+
+    # Repair command
+    if wants("repair"):
+        p_repair = sub.add_parser("repair", help="Fix trailing commas left in the data file by hand edits")
+        p_repair.set_defaults(func=repair)
 
     args = parser.parse_args()
     if hasattr(args, "func"):